@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import partial
 import logging
+import time
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.components.climate import (
     DOMAIN as CLIMATE_DOMAIN,
     SERVICE_SET_FAN_MODE,
@@ -23,8 +30,13 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import Event, HomeAssistant, State, callback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -34,13 +46,114 @@ from .const import (
     CONF_ENABLE_BOOST_MODE,
     CONF_OFFSET_SENSITIVITY,
     CONF_SYNC_INTERVAL,
+    CONF_PARALLEL_TARGET_CALLS,
+    CONF_DEBOUNCE_MS,
+    DEFAULT_ENABLE_TEMP_OFFSET,
+    DEFAULT_ENABLE_BOOST_MODE,
+    DEFAULT_OFFSET_SENSITIVITY,
     DEFAULT_SYNC_INTERVAL,
+    DEFAULT_PARALLEL_TARGET_CALLS,
+    DEFAULT_DEBOUNCE_MS,
     BOOST_ACTIVATION_DELAY,
     BOOST_MINIMUM_RUNTIME,
+    PREFERRED_BOOST_FAN_MODES,
+    STORAGE_VERSION,
+    TEMP_EPSILON,
+    HVAC_MODE_CONFIRM_TIMEOUT,
+    PERIODIC_SYNC_GRACE,
+    ACTIVE_SYNC_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Source states that carry no usable climate data
+_UNAVAILABLE_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
+# Source attributes that influence the sync; changes to anything else are ignored
+_RELEVANT_SOURCE_ATTRS = ("hvac_action", "temperature", "target_temp_low", "target_temp_high")
+# current_temperature only matters when offset compensation is enabled
+_RELEVANT_SOURCE_ATTRS_WITH_OFFSET = _RELEVANT_SOURCE_ATTRS + ("current_temperature",)
+
+# Target attributes that, together with the source's, make up a sync signature
+_TARGET_SIGNATURE_ATTRS = (
+    "temperature",
+    "target_temp_low",
+    "target_temp_high",
+    "current_temperature",
+    "fan_mode",
+    "swing_mode",
+)
+
+# Source actions that count as actively heating/cooling for boost
+_HEATING_OR_COOLING = frozenset((HVACAction.HEATING, HVACAction.COOLING))
+
+# Boost thresholds in seconds, to compare directly against monotonic elapsed time
+_BOOST_ACTIVATION_DELAY_S = BOOST_ACTIVATION_DELAY * 60
+_BOOST_MINIMUM_RUNTIME_S = BOOST_MINIMUM_RUNTIME * 60
+
+# Errors a target service call can fail with (HomeAssistantError covers
+# ServiceNotFound, vol.Invalid is raised when the target rejects the data)
+_SERVICE_ERRORS = (HomeAssistantError, vol.Invalid)
+
+
+def _boost_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding an entry's boost state."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+def _mono_to_wall(mono: float | None) -> str | None:
+    """Convert a monotonic timestamp to an ISO wall-clock time for storage."""
+    if mono is None:
+        return None
+    return (dt_util.utcnow() - timedelta(seconds=time.monotonic() - mono)).isoformat()
+
+
+def _wall_to_mono(wall: str | None) -> float | None:
+    """Convert a stored ISO wall-clock time back to a monotonic timestamp."""
+    if wall is None or (parsed := dt_util.parse_datetime(wall)) is None:
+        return None
+    elapsed = max(0.0, (dt_util.utcnow() - parsed).total_seconds())
+    return time.monotonic() - elapsed
+
+
+def _needs_update(current: Any, desired: Any) -> bool:
+    """Return True if the target's current value differs from the desired one."""
+    if isinstance(current, (int, float)) and isinstance(desired, (int, float)):
+        return abs(current - desired) >= TEMP_EPSILON
+    return current != desired
+
+
+@dataclass
+class SyncConfig:
+    """User-adjustable settings for a sync pair."""
+
+    enable_temp_offset: bool
+    enable_boost_mode: bool
+    offset_sensitivity: float
+    sync_interval: int
+    parallel_target_calls: bool
+    debounce_ms: int
+
+
+def _build_config(entry: ConfigEntry) -> SyncConfig:
+    """Build the sync settings from entry options, falling back to entry data.
+
+    Values are coerced once here (number selectors store floats), so the rest
+    of the integration can rely on their types.
+    """
+
+    def _get(key: str, default: Any) -> Any:
+        return entry.options.get(key, entry.data.get(key, default))
+
+    return SyncConfig(
+        enable_temp_offset=bool(_get(CONF_ENABLE_TEMP_OFFSET, DEFAULT_ENABLE_TEMP_OFFSET)),
+        enable_boost_mode=bool(_get(CONF_ENABLE_BOOST_MODE, DEFAULT_ENABLE_BOOST_MODE)),
+        offset_sensitivity=float(_get(CONF_OFFSET_SENSITIVITY, DEFAULT_OFFSET_SENSITIVITY)),
+        sync_interval=int(_get(CONF_SYNC_INTERVAL, DEFAULT_SYNC_INTERVAL)),
+        parallel_target_calls=bool(_get(CONF_PARALLEL_TARGET_CALLS, DEFAULT_PARALLEL_TARGET_CALLS)),
+        debounce_ms=int(_get(CONF_DEBOUNCE_MS, DEFAULT_DEBOUNCE_MS)),
+    )
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Climate Sync from a config entry."""
@@ -53,40 +166,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         target_entity,
     )
 
-    # Get options with fallback to data
-    enable_temp_offset = entry.options.get(
-        CONF_ENABLE_TEMP_OFFSET, entry.data.get(CONF_ENABLE_TEMP_OFFSET, True)
-    )
-    enable_boost_mode = entry.options.get(
-        CONF_ENABLE_BOOST_MODE, entry.data.get(CONF_ENABLE_BOOST_MODE, True)
-    )
-    offset_sensitivity = entry.options.get(
-        CONF_OFFSET_SENSITIVITY, entry.data.get(CONF_OFFSET_SENSITIVITY, 1.0)
-    )
-    sync_interval = entry.options.get(
-        CONF_SYNC_INTERVAL, entry.data.get(CONF_SYNC_INTERVAL, DEFAULT_SYNC_INTERVAL)
-    )
+    config = _build_config(entry)
+    sync_interval = config.sync_interval
 
-    _LOGGER.debug(
-        "Configuration: temp_offset=%s, boost_mode=%s, sensitivity=%.1f, sync_interval=%d min",
-        enable_temp_offset,
-        enable_boost_mode,
-        offset_sensitivity,
-        sync_interval,
-    )
+    _LOGGER.debug("Configuration: %s", config)
 
     sync_manager = ClimateSyncManager(
-        hass,
-        source_entity,
-        target_entity,
-        enable_temp_offset,
-        enable_boost_mode,
-        offset_sensitivity,
+        hass, source_entity, target_entity, config, _boost_store(hass, entry.entry_id)
     )
+    # Pick up a boost that was active before a reload/restart, so its saved
+    # fan/swing modes still get restored
+    await sync_manager.async_restore_boost_state()
 
     # Store the manager
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = sync_manager
+    entry.runtime_data = sync_manager
+    entry.async_on_unload(sync_manager.async_shutdown)
 
     # Start listening for state changes
     entry.async_on_unload(
@@ -97,25 +191,87 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.debug("State change listener registered for %s", source_entity)
 
-    # Set up periodic sync check
-    async def periodic_sync(now):
+    # Set up periodic sync check. It polls quickly while boost activation is
+    # pending or boost is within its minimum runtime (to hit the timing
+    # thresholds precisely), always running the check that follows, and
+    # otherwise only acts as a watchdog every sync_interval, skipping itself
+    # when a state-change-driven sync already ran within that window. Each check
+    # runs as a background task so a slow target can't hold up shutdown.
+    cancel_periodic_sync: CALLBACK_TYPE | None = None
+    fast_poll = False  # Whether the pending check was scheduled for boost timing
+
+    @callback
+    def periodic_sync(now: datetime) -> None:
+        """Start the periodic sync check."""
+        entry.async_create_background_task(
+            hass, async_periodic_sync(now), f"climate_sync periodic sync {target_entity}"
+        )
+
+    async def async_periodic_sync(now: datetime) -> None:
         """Perform periodic sync check."""
-        _LOGGER.debug("Periodic sync check triggered at %s", now)
-        await sync_manager.async_sync_state()
+        since_last_sync = sync_manager.seconds_since_last_sync
+        if (
+            not fast_poll
+            and not sync_manager.boost_timing_active
+            and since_last_sync < sync_interval * 60 - PERIODIC_SYNC_GRACE
+        ):
+            _LOGGER.debug(
+                "Periodic sync check at %s skipped, last sync %.0f seconds ago",
+                now,
+                since_last_sync,
+            )
+        else:
+            _LOGGER.debug("Periodic sync check triggered at %s", now)
+            await sync_manager.async_sync_state()
+        schedule_periodic_sync()
 
-    entry.async_on_unload(
-        async_track_time_interval(
-            hass,
-            periodic_sync,
-            timedelta(minutes=sync_interval),
+    @callback
+    def schedule_periodic_sync() -> None:
+        """Schedule the next periodic sync check, replacing any pending one."""
+        nonlocal cancel_periodic_sync, fast_poll
+        if cancel_periodic_sync is not None:
+            cancel_periodic_sync()
+        fast_poll = sync_manager.boost_timing_active
+        if fast_poll:
+            delay = ACTIVE_SYNC_INTERVAL
+        else:
+            delay = sync_interval * 60
+        cancel_periodic_sync = async_call_later(hass, delay, periodic_sync)
+
+    @callback
+    def async_cancel_periodic_sync() -> None:
+        """Cancel the pending periodic sync check."""
+        if cancel_periodic_sync is not None:
+            cancel_periodic_sync()
+
+    entry.async_on_unload(async_cancel_periodic_sync)
+
+    @callback
+    def async_boost_timing_started() -> None:
+        """Switch to fast polling as soon as boost timing starts, not at the next slow tick."""
+        if not fast_poll:
+            schedule_periodic_sync()
+
+    sync_manager.async_set_boost_timing_listener(async_boost_timing_started)
+
+    # Perform the initial sync once Home Assistant has started, off the setup path,
+    # so a target integration that is still starting can't stall or time out setup
+    @callback
+    def initial_sync(_hass: HomeAssistant) -> None:
+        """Start the initial sync."""
+        _LOGGER.debug("Performing initial sync")
+        entry.async_create_background_task(
+            hass, sync_manager.async_sync_state(), f"climate_sync initial sync {target_entity}"
         )
-    )
 
-    _LOGGER.info("Periodic sync scheduled every %d minutes", sync_interval)
+    entry.async_on_unload(async_at_started(hass, initial_sync))
 
-    # Perform initial sync
-    _LOGGER.debug("Performing initial sync")
-    await sync_manager.async_sync_state()
+    schedule_periodic_sync()
+    _LOGGER.info(
+        "Periodic sync scheduled every %d minutes (%d seconds while boost timing is running)",
+        sync_interval,
+        ACTIVE_SYNC_INTERVAL,
+    )
 
     # Listen for options updates
     entry.async_on_unload(entry.add_update_listener(async_update_options))
@@ -126,18 +282,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    _LOGGER.info("Options updated, reloading integration")
-    # Reload the integration when options change
-    await hass.config_entries.async_reload(entry.entry_id)
+    sync_manager: ClimateSyncManager = entry.runtime_data
+    config = _build_config(entry)
+
+    # The periodic timer is built around sync_interval, so changing it needs a reload
+    if config.sync_interval != sync_manager.config.sync_interval:
+        _LOGGER.info("Options updated, reloading integration")
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    _LOGGER.info("Options updated, applying without reload")
+    sync_manager.async_update_config(config)
+    entry.async_create_background_task(
+        hass, sync_manager.async_sync_state(), f"climate_sync options sync {sync_manager.target_entity}"
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading Climate Sync integration")
-    hass.data[DOMAIN].pop(entry.entry_id)
+    # Let a running sync finish (and refuse new ones) first, so a reload or removal
+    # sees the final boost state and nothing writes to the target or store afterwards
+    sync_manager: ClimateSyncManager = entry.runtime_data
+    await sync_manager.async_stop()
+    # Listeners, timers and the manager's debouncer are released via entry.async_on_unload
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored boost state of a deleted config entry."""
+    await _boost_store(hass, entry.entry_id).async_remove()
+
+
 class ClimateSyncManager:
     """Manages synchronization between two climate entities."""
 
@@ -146,35 +322,146 @@ class ClimateSyncManager:
         hass: HomeAssistant,
         source_entity: str,
         target_entity: str,
-        enable_temp_offset: bool,
-        enable_boost_mode: bool,
-        offset_sensitivity: float,
+        config: SyncConfig,
+        store: Store[dict[str, Any]],
     ) -> None:
         """Initialize the sync manager."""
         self.hass = hass
         self.source_entity = source_entity
         self.target_entity = target_entity
-        self.enable_temp_offset = enable_temp_offset
-        self.enable_boost_mode = enable_boost_mode
-        self.offset_sensitivity = offset_sensitivity
-        self._syncing = False  # Prevent recursive updates
+        self.config = config
+        self._store = store  # Persists boost state so the saved modes survive a reload
+        self._stopped = False  # Set on unload; no further syncs are started
+        self._boost_timing_listener: CALLBACK_TYPE | None = None  # Called when boost timing starts
+        self._sync_lock = asyncio.Lock()  # Prevent overlapping syncs
+        self._sync_pending = False  # Another sync was requested while one was running
+        # Source attributes whose changes trigger a sync, and their last scheduled values
+        self._relevant_source_attrs = (
+            _RELEVANT_SOURCE_ATTRS_WITH_OFFSET if config.enable_temp_offset else _RELEVANT_SOURCE_ATTRS
+        )
+        self._last_relevant_key: tuple[Any, ...] | None = None
+        self._latest_source_state: State | None = None  # Newest source state from the event stream
+        self._pending_source_state: State | None = None  # Source state for the queued follow-up sync
         self._boost_active = False  # Track if boost mode is active
+        self._boost_exit_pending = False  # Boost exit ran but its restore failed; retry it
         self._saved_fan_mode: str | None = None  # Save fan mode before boost
         self._saved_swing_mode: str | None = None  # Save swing mode before boost
-        self._heating_cooling_start_time: datetime | None = None  # When heating/cooling started
-        self._boost_start_time: datetime | None = None  # When boost mode started
+        self._heating_cooling_start_mono: float | None = None  # When heating/cooling started (monotonic)
+        self._boost_start_mono: float | None = None  # When boost mode started (monotonic)
+        self._last_sync_monotonic: float | None = None  # When the last sync completed
+        self._last_sync_signature: tuple[Any, ...] | None = None  # Source/target state at the last sync
+        self._last_sync_fp: tuple[Any, ...] | None = None  # Inputs of the last successful normal sync
+        self._mode_in_set_temperature = True  # Target honours hvac_mode in set_temperature
+        self._combined_mode_sent: str | None = None  # Mode last sent within set_temperature, until confirmed
+        self._combined_mode_sent_mono: float | None = None  # When that combined call was sent
+        self._cached_target_fan_modes: tuple[str, ...] | None = None  # fan_modes the boost fan was picked from
+        self._cached_boost_fan_mode: str | None = None  # Best boost fan mode for those fan_modes
+        # Collapse bursts of source state changes into a single sync that runs at
+        # the end of the window, so it sees the final state of the burst
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=config.debounce_ms / 1000,
+            immediate=False,
+            function=self._async_debounced_sync,
+            background=True,
+        )
+
+    @property
+    def seconds_since_last_sync(self) -> float:
+        """Return seconds since the last completed sync (infinite if none yet)."""
+        if self._last_sync_monotonic is None:
+            return float("inf")
+        return time.monotonic() - self._last_sync_monotonic
+
+    @property
+    def boost_timing_active(self) -> bool:
+        """Return True while a boost decision depends on elapsed time.
+
+        That is while boost activation is pending, or while boost is active and
+        its minimum runtime hasn't passed yet. After that, only state changes
+        (which trigger their own syncs) can end boost.
+        """
+        if self._boost_active:
+            return (
+                self._boost_start_mono is not None
+                and time.monotonic() - self._boost_start_mono < _BOOST_MINIMUM_RUNTIME_S
+            )
+        return self._heating_cooling_start_mono is not None
 
     @callback
-    def async_source_changed(self, event: Event) -> None:
-        """Handle state changes from the source climate entity."""
-        if self._syncing:
-            _LOGGER.debug("[%s] Sync already in progress, skipping", self.source_entity)
+    def async_update_config(self, config: SyncConfig) -> None:
+        """Apply new settings in place."""
+        self.config = config
+        self._relevant_source_attrs = (
+            _RELEVANT_SOURCE_ATTRS_WITH_OFFSET if config.enable_temp_offset else _RELEVANT_SOURCE_ATTRS
+        )
+        self._debouncer.cooldown = config.debounce_ms / 1000
+        # Forget what was last applied so the next sync uses the new settings
+        self._last_relevant_key = None
+        self._last_sync_signature = None
+        self._last_sync_fp = None
+
+    async def async_restore_boost_state(self) -> None:
+        """Load boost state persisted before a reload or restart."""
+        data = await self._store.async_load()
+        if not data or not data.get("boost_active"):
             return
+        self._boost_active = True
+        self._saved_fan_mode = data.get("saved_fan_mode")
+        self._saved_swing_mode = data.get("saved_swing_mode")
+        # Timings are stored as wall-clock times (monotonic ones don't survive a
+        # restart), so the minimum runtime still applies and a source that keeps
+        # heating/cooling keeps boost instead of waiting out the activation delay
+        self._boost_start_mono = _wall_to_mono(data.get("boost_start"))
+        self._heating_cooling_start_mono = _wall_to_mono(data.get("heating_cooling_start"))
+        _LOGGER.info(
+            "[%s] Restored boost state - saved fan_mode: %s, swing_mode: %s",
+            self.target_entity,
+            self._saved_fan_mode,
+            self._saved_swing_mode,
+        )
+
+    async def _async_save_boost_state(self) -> None:
+        """Write the boost state to the store."""
+        await self._store.async_save(
+            {
+                "boost_active": self._boost_active,
+                "saved_fan_mode": self._saved_fan_mode,
+                "saved_swing_mode": self._saved_swing_mode,
+                "boost_start": _mono_to_wall(self._boost_start_mono),
+                "heating_cooling_start": _mono_to_wall(self._heating_cooling_start_mono),
+            }
+        )
+
+    @callback
+    def async_set_boost_timing_listener(self, listener: CALLBACK_TYPE) -> None:
+        """Set a callback to run when a sync starts boost timing."""
+        self._boost_timing_listener = listener
+
+    async def async_stop(self) -> None:
+        """Refuse new syncs and wait for a running one to finish."""
+        self._stopped = True
+        self._debouncer.async_shutdown()
+        async with self._sync_lock:
+            pass
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel any pending debounced sync and refuse new ones."""
+        self._debouncer.async_shutdown()
 
+    @callback
+    def async_source_changed(self, event: Event) -> None:
+        """Handle state changes from the source climate entity."""
         new_state = event.data.get("new_state")
         old_state = event.data.get("old_state")
 
-        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if new_state is None or new_state.state in _UNAVAILABLE_STATES:
+            # Forget the last synced fields too, so the source coming back with the
+            # same values still triggers a sync
+            self._latest_source_state = None
+            self._last_relevant_key = None
             _LOGGER.debug(
                 "[%s] Source state unavailable or unknown: %s",
                 self.source_entity,
@@ -182,6 +469,21 @@ class ClimateSyncManager:
             )
             return
 
+        # Keep the newest state even if it's filtered below, so the debounced sync
+        # can use it directly instead of looking it up again
+        self._latest_source_state = new_state
+
+        # Ignore updates that don't touch anything we sync (e.g. sensor jitter) by
+        # comparing the synced fields against those of the last scheduled sync
+        new_attrs = new_state.attributes
+        relevant_key = (
+            new_state.state,
+            *(new_attrs.get(key) for key in self._relevant_source_attrs),
+        )
+        if relevant_key == self._last_relevant_key:
+            return
+        self._last_relevant_key = relevant_key
+
         _LOGGER.info(
             "[%s] Source state changed: %s → %s (action: %s)",
             self.source_entity,
@@ -190,167 +492,233 @@ class ClimateSyncManager:
             new_state.attributes.get("hvac_action", "unknown"),
         )
 
-        # Schedule sync
-        self.hass.async_create_task(self.async_sync_state())
+        # Schedule sync (debounced so bursts of updates collapse into one)
+        self._debouncer.async_schedule_call()
+
+    async def _async_debounced_sync(self) -> None:
+        """Run the debounced sync with the source state delivered by the last event."""
+        source_state, self._latest_source_state = self._latest_source_state, None
+        await self.async_sync_state(source_state)
+
+    async def async_sync_state(self, source_state: State | None = None) -> None:
+        """Synchronize the target climate entity with the source.
 
-    async def async_sync_state(self) -> None:
-        """Synchronize the target climate entity with the source."""
-        if self._syncing:
-            _LOGGER.debug("[%s → %s] Sync already in progress, skipping", self.source_entity, self.target_entity)
+        source_state is the source's state when the caller already has it (from a
+        state change event); otherwise it is looked up from the state machine.
+        """
+        # A request arriving mid-sync is queued (at most one) rather than dropped,
+        # so the latest source state is always applied. Checking locked() and
+        # acquiring happen without an await in between, so syncs never overlap.
+        if self._stopped:
+            return
+        if self._sync_lock.locked():
+            self._sync_pending = True
+            self._pending_source_state = source_state
             return
 
-        self._syncing = True
-        _LOGGER.debug("[%s → %s] Starting sync operation", self.source_entity, self.target_entity)
+        async with self._sync_lock:
+            timing_was_active = self.boost_timing_active
+            await self._async_sync_state(source_state)
+            while self._sync_pending and not self._stopped:
+                self._sync_pending = False
+                source_state, self._pending_source_state = self._pending_source_state, None
+                await self._async_sync_state(source_state)
+            if (
+                not timing_was_active
+                and self.boost_timing_active
+                and self._boost_timing_listener is not None
+            ):
+                self._boost_timing_listener()
+
+    async def _async_sync_state(self, source_state: State | None = None) -> None:
+        """Run a single sync; callers must hold the sync lock."""
+        source_entity = self.source_entity
+        target_entity = self.target_entity
+        _LOGGER.debug("[%s → %s] Starting sync operation", source_entity, target_entity)
 
         try:
-            source_state = self.hass.states.get(self.source_entity)
-            target_state = self.hass.states.get(self.target_entity)
+            if source_state is None:
+                source_state = self.hass.states.get(source_entity)
+            target_state = self.hass.states.get(target_entity)
 
             if not source_state or not target_state:
                 _LOGGER.warning(
                     "[%s → %s] Source or target entity not found: source=%s (found=%s), target=%s (found=%s)",
-                    self.source_entity,
-                    self.target_entity,
-                    self.source_entity,
+                    source_entity,
+                    target_entity,
+                    source_entity,
                     source_state is not None,
-                    self.target_entity,
+                    target_entity,
                     target_state is not None,
                 )
                 return
 
-            if source_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                _LOGGER.debug("[%s → %s] Source entity unavailable, skipping sync", self.source_entity, self.target_entity)
-                return
+            src_state = source_state.state
+            tgt_state = target_state.state
+            if tgt_state == self._combined_mode_sent:
+                # The target took the mode sent within set_temperature
+                self._combined_mode_sent = None
+            src_attrs = source_state.attributes
+            tgt_attrs = target_state.attributes
 
-            # Get source properties
-            source_hvac_mode = source_state.state
-            source_hvac_action = source_state.attributes.get("hvac_action")
-            source_temp = source_state.attributes.get("current_temperature")
-            source_target_temp = source_state.attributes.get("temperature")
-            source_target_temp_low = source_state.attributes.get("target_temp_low")
-            source_target_temp_high = source_state.attributes.get("target_temp_high")
+            if src_state in _UNAVAILABLE_STATES:
+                _LOGGER.debug("[%s → %s] Source entity unavailable, skipping sync", source_entity, target_entity)
+                return
 
-            _LOGGER.debug(
-                "[%s] Source state: mode=%s, action=%s, current_temp=%s, target_temp=%s, low=%s, high=%s",
-                self.source_entity,
-                source_hvac_mode,
-                source_hvac_action,
-                source_temp,
-                source_target_temp,
-                source_target_temp_low,
-                source_target_temp_high,
+            # Nothing to do if neither entity changed since the last sync, unless boost
+            # timing is running (its thresholds depend on elapsed time, not state)
+            sync_signature = (
+                src_state,
+                *(src_attrs.get(key) for key in _RELEVANT_SOURCE_ATTRS_WITH_OFFSET),
+                tgt_state,
+                *(tgt_attrs.get(key) for key in _TARGET_SIGNATURE_ATTRS),
             )
+            if sync_signature == self._last_sync_signature and not self.boost_timing_active:
+                _LOGGER.debug("[%s → %s] Source and target unchanged since last sync, skipping", source_entity, target_entity)
+                return
+
+            # Skip assembling the verbose debug output below unless it will be emitted
+            debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+
+            # Get source properties
+            source_hvac_mode = src_state
+            source_hvac_action = src_attrs.get("hvac_action")
+            source_temp = src_attrs.get("current_temperature")
+            source_target_temp = src_attrs.get("temperature")
+            source_target_temp_low = src_attrs.get("target_temp_low")
+            source_target_temp_high = src_attrs.get("target_temp_high")
+
+            if debug_enabled:
+                _LOGGER.debug(
+                    "[%s] Source state: mode=%s, action=%s, current_temp=%s, target_temp=%s, low=%s, high=%s",
+                    source_entity,
+                    source_hvac_mode,
+                    source_hvac_action,
+                    source_temp,
+                    source_target_temp,
+                    source_target_temp_low,
+                    source_target_temp_high,
+                )
 
             # Get target properties
-            target_temp = target_state.attributes.get("current_temperature")
-            target_min_temp = target_state.attributes.get("min_temp", 16)
-            target_max_temp = target_state.attributes.get("max_temp", 30)
+            target_temp = tgt_attrs.get("current_temperature")
+            target_min_temp = tgt_attrs.get("min_temp", 16)
+            target_max_temp = tgt_attrs.get("max_temp", 30)
             # Get separate heat/cool ranges if available
-            target_min_heat_temp = target_state.attributes.get("min_heat_temp", target_min_temp)
-            target_max_heat_temp = target_state.attributes.get("max_heat_temp", target_max_temp)
-            target_min_cool_temp = target_state.attributes.get("min_cool_temp", target_min_temp)
-            target_max_cool_temp = target_state.attributes.get("max_cool_temp", target_max_temp)
-            target_fan_modes = target_state.attributes.get("fan_modes", [])
-            target_swing_modes = target_state.attributes.get("swing_modes", [])
-
-            _LOGGER.debug(
-                "[%s] Target state: mode=%s, current_temp=%s, min=%s, max=%s, heat_range=%s-%s, cool_range=%s-%s, fan_modes=%s, swing_modes=%s",
-                self.target_entity,
-                target_state.state,
-                target_temp,
-                target_min_temp,
-                target_max_temp,
-                target_min_heat_temp,
-                target_max_heat_temp,
-                target_min_cool_temp,
-                target_max_cool_temp,
-                target_fan_modes,
-                target_swing_modes,
-            )
+            target_min_heat_temp = tgt_attrs.get("min_heat_temp", target_min_temp)
+            target_max_heat_temp = tgt_attrs.get("max_heat_temp", target_max_temp)
+            target_min_cool_temp = tgt_attrs.get("min_cool_temp", target_min_temp)
+            target_max_cool_temp = tgt_attrs.get("max_cool_temp", target_max_temp)
+            target_fan_modes = tgt_attrs.get("fan_modes", [])
+            target_swing_modes = tgt_attrs.get("swing_modes", [])
+
+            if debug_enabled:
+                _LOGGER.debug(
+                    "[%s] Target state: mode=%s, current_temp=%s, min=%s, max=%s, heat_range=%s-%s, cool_range=%s-%s, fan_modes=%s, swing_modes=%s",
+                    target_entity,
+                    tgt_state,
+                    target_temp,
+                    target_min_temp,
+                    target_max_temp,
+                    target_min_heat_temp,
+                    target_max_heat_temp,
+                    target_min_cool_temp,
+                    target_max_cool_temp,
+                    target_fan_modes,
+                    target_swing_modes,
+                )
 
             # Check if boost mode should be activated
-            is_actively_heating_or_cooling = source_hvac_action in (
-                HVACAction.HEATING,
-                HVACAction.COOLING,
-            )
-
-            # Track heating/cooling start time
-            now = datetime.now()
-            if is_actively_heating_or_cooling:
-                if self._heating_cooling_start_time is None:
-                    self._heating_cooling_start_time = now
+            is_actively_heating_or_cooling = source_hvac_action in _HEATING_OR_COOLING
+
+            # Track heating/cooling start time (monotonic, so clock jumps don't skew elapsed time);
+            # only needed for boost, so it isn't tracked while boost mode is disabled
+            now_mono = time.monotonic()
+            if is_actively_heating_or_cooling and self.config.enable_boost_mode:
+                if self._heating_cooling_start_mono is None:
+                    self._heating_cooling_start_mono = now_mono
                     _LOGGER.info(
                         "[%s] Source started heating/cooling at %s, will activate boost after %d minutes",
-                        self.source_entity,
-                        self._heating_cooling_start_time,
+                        source_entity,
+                        datetime.now(),
                         BOOST_ACTIVATION_DELAY,
                     )
             else:
                 # Reset timer when not actively heating/cooling
-                if self._heating_cooling_start_time is not None:
-                    _LOGGER.info("[%s] Source stopped heating/cooling, resetting activation timer", self.source_entity)
-                self._heating_cooling_start_time = None
+                if self._heating_cooling_start_mono is not None:
+                    _LOGGER.info("[%s] Source stopped heating/cooling, resetting activation timer", source_entity)
+                self._heating_cooling_start_mono = None
 
             # Determine if we should activate boost mode
             should_activate_boost = False
-            if self.enable_boost_mode and is_actively_heating_or_cooling:
-                if self._heating_cooling_start_time is not None:
-                    elapsed_minutes = (now - self._heating_cooling_start_time).total_seconds() / 60
-                    if elapsed_minutes >= BOOST_ACTIVATION_DELAY:
-                        should_activate_boost = True
+            if self.config.enable_boost_mode and is_actively_heating_or_cooling:
+                if self._heating_cooling_start_mono is not None:
+                    elapsed_s = now_mono - self._heating_cooling_start_mono
+                    should_activate_boost = elapsed_s >= _BOOST_ACTIVATION_DELAY_S
+                    if debug_enabled:
+                        elapsed_minutes = elapsed_s / 60
+                        if should_activate_boost:
+                            _LOGGER.debug(
+                                "[%s → %s] Boost activation: %.1f minutes elapsed, threshold is %d minutes",
+                                source_entity,
+                                target_entity,
+                                elapsed_minutes,
+                                BOOST_ACTIVATION_DELAY,
+                            )
+                        else:
+                            _LOGGER.debug(
+                                "[%s → %s] Boost activation: waiting %.1f more minutes (%.1f/%d elapsed)",
+                                source_entity,
+                                target_entity,
+                                BOOST_ACTIVATION_DELAY - elapsed_minutes,
+                                elapsed_minutes,
+                                BOOST_ACTIVATION_DELAY,
+                            )
+
+            # Check if we should exit boost mode (must stay in boost for minimum runtime)
+            can_exit_boost = True
+            if self._boost_active and self._boost_start_mono is not None:
+                boost_elapsed_s = now_mono - self._boost_start_mono
+                can_exit_boost = boost_elapsed_s >= _BOOST_MINIMUM_RUNTIME_S
+                if debug_enabled:
+                    boost_elapsed_minutes = boost_elapsed_s / 60
+                    if not can_exit_boost:
                         _LOGGER.debug(
-                            "[%s → %s] Boost activation: %.1f minutes elapsed, threshold is %d minutes",
-                            self.source_entity,
-                            self.target_entity,
-                            elapsed_minutes,
-                            BOOST_ACTIVATION_DELAY,
+                            "[%s → %s] Boost mode: must stay active for %.1f more minutes (%.1f/%d elapsed)",
+                            source_entity,
+                            target_entity,
+                            BOOST_MINIMUM_RUNTIME - boost_elapsed_minutes,
+                            boost_elapsed_minutes,
+                            BOOST_MINIMUM_RUNTIME,
                         )
                     else:
                         _LOGGER.debug(
-                            "[%s → %s] Boost activation: waiting %.1f more minutes (%.1f/%d elapsed)",
-                            self.source_entity,
-                            self.target_entity,
-                            BOOST_ACTIVATION_DELAY - elapsed_minutes,
-                            elapsed_minutes,
-                            BOOST_ACTIVATION_DELAY,
+                            "[%s → %s] Boost mode: minimum runtime satisfied (%.1f/%d minutes)",
+                            source_entity,
+                            target_entity,
+                            boost_elapsed_minutes,
+                            BOOST_MINIMUM_RUNTIME,
                         )
 
-            # Check if we should exit boost mode (must stay in boost for minimum runtime)
-            can_exit_boost = True
-            if self._boost_active and self._boost_start_time is not None:
-                boost_elapsed_minutes = (now - self._boost_start_time).total_seconds() / 60
-                if boost_elapsed_minutes < BOOST_MINIMUM_RUNTIME:
-                    can_exit_boost = False
-                    _LOGGER.debug(
-                        "[%s → %s] Boost mode: must stay active for %.1f more minutes (%.1f/%d elapsed)",
-                        self.source_entity,
-                        self.target_entity,
-                        BOOST_MINIMUM_RUNTIME - boost_elapsed_minutes,
-                        boost_elapsed_minutes,
-                        BOOST_MINIMUM_RUNTIME,
-                    )
-                else:
-                    _LOGGER.debug(
-                        "[%s → %s] Boost mode: minimum runtime satisfied (%.1f/%d minutes)",
-                        self.source_entity,
-                        self.target_entity,
-                        boost_elapsed_minutes,
-                        BOOST_MINIMUM_RUNTIME,
-                    )
-
-            _LOGGER.debug(
-                "[%s → %s] Boost mode decision: enabled=%s, actively_heating_cooling=%s, should_activate=%s, can_exit=%s, boost_active=%s",
-                self.source_entity,
-                self.target_entity,
-                self.enable_boost_mode,
-                is_actively_heating_or_cooling,
-                should_activate_boost,
-                can_exit_boost,
-                self._boost_active,
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "[%s → %s] Boost mode decision: enabled=%s, actively_heating_cooling=%s, should_activate=%s, can_exit=%s, boost_active=%s",
+                    source_entity,
+                    target_entity,
+                    self.config.enable_boost_mode,
+                    is_actively_heating_or_cooling,
+                    should_activate_boost,
+                    can_exit_boost,
+                    self._boost_active,
+                )
 
-            if should_activate_boost or (self._boost_active and not can_exit_boost):
-                _LOGGER.info("[%s → %s] Activating/maintaining boost mode for %s", self.source_entity, self.target_entity, source_hvac_action)
+            if source_hvac_mode == HVACMode.OFF and not self._boost_active:
+                # Nothing else matters for a source that is off: skip the offset and
+                # setpoint work and just turn the target off
+                _LOGGER.info("[%s → %s] Source is off, syncing HVAC mode only", source_entity, target_entity)
+                await self._async_set_target_mode(HVACMode.OFF, tgt_state)
+            elif should_activate_boost or (self._boost_active and not can_exit_boost):
+                _LOGGER.info("[%s → %s] Activating/maintaining boost mode for %s", source_entity, target_entity, source_hvac_action)
                 await self._async_activate_boost_mode(
                     source_hvac_action,
                     target_state,
@@ -360,13 +728,13 @@ class ClimateSyncManager:
                     target_swing_modes,
                 )
             else:
-                _LOGGER.info("[%s → %s] Syncing in normal mode", self.source_entity, self.target_entity)
+                _LOGGER.info("[%s → %s] Syncing in normal mode", source_entity, target_entity)
                 # Normal sync mode (or exiting boost mode)
                 # Get current target state for comparison
-                current_target_hvac_mode = target_state.state
-                current_target_temp_low = target_state.attributes.get("target_temp_low")
-                current_target_temp_high = target_state.attributes.get("target_temp_high")
-                current_target_temp = target_state.attributes.get("temperature")
+                current_target_hvac_mode = tgt_state
+                current_target_temp_low = tgt_attrs.get("target_temp_low")
+                current_target_temp_high = tgt_attrs.get("target_temp_high")
+                current_target_temp = tgt_attrs.get("temperature")
 
                 await self._async_sync_normal_mode(
                     source_hvac_mode,
@@ -385,14 +753,22 @@ class ClimateSyncManager:
                     current_target_temp_low,
                     current_target_temp_high,
                     current_target_temp,
+                    target_state,
                 )
 
-            _LOGGER.debug("[%s → %s] Sync operation completed successfully", self.source_entity, self.target_entity)
+            self._last_sync_monotonic = time.monotonic()
+            # A sync whose outcome depended on elapsed time (e.g. boost held for its
+            # minimum runtime), whose mode change isn't confirmed yet or whose boost
+            # restore failed must not let an unchanged state skip the next one
+            self._last_sync_signature = (
+                None
+                if self.boost_timing_active or self._combined_mode_sent or self._boost_exit_pending
+                else sync_signature
+            )
+            _LOGGER.debug("[%s → %s] Sync operation completed successfully", source_entity, target_entity)
 
         except Exception as e:
             _LOGGER.exception("Error syncing climate state: %s", e)
-        finally:
-            self._syncing = False
 
     async def _async_activate_boost_mode(
         self,
@@ -404,20 +780,28 @@ class ClimateSyncManager:
         target_swing_modes: list[str],
     ) -> None:
         """Activate boost mode: extreme setpoint and max fan speed."""
+        target_entity = self.target_entity
+        tgt_attrs = target_state.attributes
         # Save current settings on first activation
         if not self._boost_active:
-            self._saved_fan_mode = target_state.attributes.get("fan_mode")
-            self._saved_swing_mode = target_state.attributes.get("swing_mode")
-            self._boost_start_time = datetime.now()
+            self._saved_fan_mode = tgt_attrs.get("fan_mode")
+            self._saved_swing_mode = tgt_attrs.get("swing_mode")
+            self._boost_start_mono = time.monotonic()
             _LOGGER.info(
                 "[%s] Entering boost mode at %s - saved fan_mode: %s, swing_mode: %s (minimum runtime: %d minutes)",
-                self.target_entity,
-                self._boost_start_time,
+                target_entity,
+                datetime.now(),
                 self._saved_fan_mode,
                 self._saved_swing_mode,
                 BOOST_MINIMUM_RUNTIME,
             )
             self._boost_active = True
+            self._last_sync_fp = None
+            self._last_relevant_key = None
+            await self._async_save_boost_state()
+
+        # A boost exit whose restore failed is superseded; the saved modes are kept
+        self._boost_exit_pending = False
 
         # Set extreme temperature based on action
         if hvac_action == HVACAction.HEATING:
@@ -429,89 +813,343 @@ class ClimateSyncManager:
 
         _LOGGER.info(
             "[%s] Boost mode: setting mode=%s, temp=%s",
-            self.target_entity,
+            target_entity,
             hvac_mode,
             boost_temp,
         )
 
-        # Set HVAC mode and temperature
-        try:
-            await self.hass.services.async_call(
-                CLIMATE_DOMAIN,
-                SERVICE_SET_HVAC_MODE,
-                {
-                    ATTR_ENTITY_ID: self.target_entity,
-                    ATTR_HVAC_MODE: hvac_mode,
-                },
-                blocking=True,
+        # Set HVAC mode and temperature in a single set_temperature call where the
+        # target honours hvac_mode there. A mode change always re-sends the setpoint
+        # since many units keep one per mode, and must land before fan/swing, whose
+        # options can depend on it.
+        mode_changed = _needs_update(target_state.state, hvac_mode)
+        calls: list[tuple[str, dict[str, Any]]] = []
+        if mode_changed:
+            await self._async_set_target_temperature(
+                {ATTR_ENTITY_ID: target_entity, ATTR_TEMPERATURE: boost_temp},
+                hvac_mode,
             )
-            _LOGGER.debug("HVAC mode set to %s", hvac_mode)
-        except Exception as e:
-            _LOGGER.error("Failed to set HVAC mode: %s", e)
-            raise
-
-        try:
-            await self.hass.services.async_call(
-                CLIMATE_DOMAIN,
-                SERVICE_SET_TEMPERATURE,
-                {
-                    ATTR_ENTITY_ID: self.target_entity,
-                    ATTR_TEMPERATURE: boost_temp,
-                },
-                blocking=True,
+        elif not _needs_update(tgt_attrs.get(ATTR_TEMPERATURE), boost_temp):
+            _LOGGER.debug("HVAC mode and temperature already %s/%s - skipping update", hvac_mode, boost_temp)
+        else:
+            calls.append(
+                (
+                    SERVICE_SET_TEMPERATURE,
+                    {ATTR_ENTITY_ID: target_entity, ATTR_TEMPERATURE: boost_temp},
+                )
             )
-            _LOGGER.debug("Temperature set to %s", boost_temp)
-        except Exception as e:
-            _LOGGER.error("Failed to set temperature: %s", e)
-            raise
 
-        # Set fan to max if available
-        max_fan_modes = ["superPowerful", "powerful", "high", "medium", "low", "auto"]
-        selected_fan = None
-        for fan_mode in max_fan_modes:
-            if fan_mode in target_fan_modes:
-                selected_fan = fan_mode
-                break
+        # Set fan to max if available (only re-picked when the target's fan_modes change)
+        fan_modes_key = tuple(target_fan_modes or ())
+        if fan_modes_key != self._cached_target_fan_modes:
+            fan_set = frozenset(fan_modes_key)
+            self._cached_target_fan_modes = fan_modes_key
+            self._cached_boost_fan_mode = next(
+                (fan_mode for fan_mode in PREFERRED_BOOST_FAN_MODES if fan_mode in fan_set),
+                None,
+            )
+        selected_fan = self._cached_boost_fan_mode
 
-        if selected_fan:
+        if selected_fan and not _needs_update(tgt_attrs.get("fan_mode"), selected_fan):
+            _LOGGER.debug("Fan mode already %s - skipping update", selected_fan)
+        elif selected_fan:
             _LOGGER.debug("Setting fan mode to %s", selected_fan)
-            try:
-                await self.hass.services.async_call(
-                    CLIMATE_DOMAIN,
+            calls.append(
+                (
                     SERVICE_SET_FAN_MODE,
-                    {
-                        ATTR_ENTITY_ID: self.target_entity,
-                        "fan_mode": selected_fan,
-                    },
-                    blocking=True,
+                    {ATTR_ENTITY_ID: target_entity, "fan_mode": selected_fan},
                 )
-                _LOGGER.debug("Fan mode set successfully")
-            except Exception as e:
-                _LOGGER.error("Failed to set fan mode: %s", e)
-                raise
+            )
         else:
             _LOGGER.debug("No suitable fan mode found in %s", target_fan_modes)
 
         # Set swing/vane to auto if available
-        if "auto" in target_swing_modes:
+        swing_set = frozenset(target_swing_modes or ())
+        if "auto" in swing_set and not _needs_update(tgt_attrs.get("swing_mode"), "auto"):
+            _LOGGER.debug("Swing mode already auto - skipping update")
+        elif "auto" in swing_set:
             _LOGGER.debug("Setting swing mode to auto")
-            try:
-                await self.hass.services.async_call(
-                    CLIMATE_DOMAIN,
+            calls.append(
+                (
                     SERVICE_SET_SWING_MODE,
-                    {
-                        ATTR_ENTITY_ID: self.target_entity,
-                        "swing_mode": "auto",
-                    },
-                    blocking=True,
+                    {ATTR_ENTITY_ID: target_entity, "swing_mode": "auto"},
                 )
-                _LOGGER.debug("Swing mode set successfully")
-            except Exception as e:
-                _LOGGER.error("Failed to set swing mode: %s", e)
-                raise
+            )
         else:
             _LOGGER.debug("Auto swing mode not available in %s", target_swing_modes)
 
+        # Failures are logged per call; a fan/swing the target rejects shouldn't abort the sync
+        await self._async_call_target_services(calls)
+
+    async def _async_call_target_service(self, service: str, data: dict[str, Any]) -> None:
+        """Call a climate service on the target that the rest of the sync depends on.
+
+        Failures are logged and re-raised, so the sync is retried on the next run.
+        """
+        try:
+            await self.hass.services.async_call(CLIMATE_DOMAIN, service, data, blocking=True)
+        except _SERVICE_ERRORS as e:
+            _LOGGER.error("Failed to call %s with %s: %s", service, data, e)
+            raise
+        _LOGGER.debug("Called %s with %s", service, data)
+
+    async def _async_set_target_temperature(
+        self, service_data: dict[str, Any], hvac_mode: str | None
+    ) -> None:
+        """Set the target's setpoints, switching it to hvac_mode as well if given.
+
+        The mode is sent within set_temperature where the target honours it. A target
+        that is still not in that mode when a later sync sends it again (and enough
+        time has passed for a slow, polled target to report it) is taken to ignore
+        it there, and gets a separate set_hvac_mode from then on.
+        """
+        if hvac_mode is None:
+            await self._async_call_target_service(SERVICE_SET_TEMPERATURE, service_data)
+            return
+
+        if (
+            self._mode_in_set_temperature
+            and self._combined_mode_sent == hvac_mode
+            and self._combined_mode_sent_mono is not None
+            and time.monotonic() - self._combined_mode_sent_mono >= HVAC_MODE_CONFIRM_TIMEOUT
+        ):
+            _LOGGER.warning(
+                "[%s] Target ignored hvac_mode %s in set_temperature, setting it separately from now on",
+                self.target_entity,
+                hvac_mode,
+            )
+            self._mode_in_set_temperature = False
+            self._combined_mode_sent = None
+
+        if not self._mode_in_set_temperature:
+            # Mode first: many units keep a setpoint per mode
+            await self._async_call_target_service(
+                SERVICE_SET_HVAC_MODE,
+                {ATTR_ENTITY_ID: self.target_entity, ATTR_HVAC_MODE: hvac_mode},
+            )
+            await self._async_call_target_service(SERVICE_SET_TEMPERATURE, service_data)
+            return
+
+        await self._async_call_target_service(
+            SERVICE_SET_TEMPERATURE, {**service_data, ATTR_HVAC_MODE: hvac_mode}
+        )
+        if self._combined_mode_sent != hvac_mode:
+            self._combined_mode_sent = hvac_mode
+            self._combined_mode_sent_mono = time.monotonic()
+
+    async def _async_call_target_services(
+        self, calls: list[tuple[str, dict[str, Any]]]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Call climate services on the target, concurrently if enabled.
+
+        Service failures are logged rather than raised so every call gets a chance to
+        run; the calls that failed are returned.
+        """
+        if not calls:
+            return []
+
+        async_call = self.hass.services.async_call
+        if self.config.parallel_target_calls:
+            results = await asyncio.gather(
+                *(
+                    async_call(CLIMATE_DOMAIN, service, data, blocking=True)
+                    for service, data in calls
+                ),
+                return_exceptions=True,
+            )
+        else:
+            results = []
+            for service, data in calls:
+                try:
+                    results.append(
+                        await async_call(CLIMATE_DOMAIN, service, data, blocking=True)
+                    )
+                except _SERVICE_ERRORS as e:
+                    results.append(e)
+
+        failed: list[tuple[str, dict[str, Any]]] = []
+        for (service, data), result in zip(calls, results):
+            if isinstance(result, _SERVICE_ERRORS):
+                _LOGGER.error("Failed to call %s with %s: %s", service, data, result)
+                failed.append((service, data))
+            elif isinstance(result, BaseException):
+                # Unexpected errors and cancellation propagate to the caller
+                raise result
+            else:
+                _LOGGER.debug("Called %s with %s", service, data)
+        return failed
+
+    async def _async_set_target_mode(self, hvac_mode: str, current_hvac_mode: str) -> None:
+        """Set the target's HVAC mode on its own, if it differs from the current one."""
+        if not _needs_update(current_hvac_mode, hvac_mode):
+            _LOGGER.debug("[%s] HVAC mode unchanged: %s - skipping update", self.target_entity, hvac_mode)
+            return
+        await self._async_call_target_service(
+            SERVICE_SET_HVAC_MODE,
+            {
+                ATTR_ENTITY_ID: self.target_entity,
+                ATTR_HVAC_MODE: hvac_mode,
+            },
+        )
+
+    @staticmethod
+    def _clamp(value: float, low: float, high: float, name: str, temp_unit: str) -> float:
+        """Clamp a setpoint to the target's supported range, warning if it had to move."""
+        clamped = min(high, max(low, value))
+        if clamped != value:
+            _LOGGER.warning(
+                "Clamped %s from %.1f%s to %.1f%s (range: %.1f-%.1f%s)",
+                name,
+                value,
+                temp_unit,
+                clamped,
+                temp_unit,
+                low,
+                high,
+                temp_unit,
+            )
+        return clamped
+
+    def _heat_cool_setpoints(
+        self,
+        source_target_temp_low: float | None,
+        source_target_temp_high: float | None,
+        temp_offset: float,
+        target_min_heat_temp: float,
+        target_max_heat_temp: float,
+        target_min_cool_temp: float,
+        target_max_cool_temp: float,
+        current_target_temp_low: float | None,
+        current_target_temp_high: float | None,
+        mode_changed: bool,
+        temp_unit: str,
+    ) -> dict[str, float]:
+        """Return the low/high setpoints to send in auto mode (empty if unchanged)."""
+        setpoints: dict[str, float] = {}
+        temp_low = None if source_target_temp_low is None else source_target_temp_low + temp_offset
+        temp_high = None if source_target_temp_high is None else source_target_temp_high + temp_offset
+
+        # Order the pair before clamping, so each end gets clamped to its own range
+        if temp_low is not None and temp_high is not None and temp_low > temp_high:
+            _LOGGER.warning(
+                "Auto mode: source low temp (%.1f%s) > high temp (%.1f%s), swapping them",
+                temp_low,
+                temp_unit,
+                temp_high,
+                temp_unit,
+            )
+            temp_low, temp_high = temp_high, temp_low
+
+        if temp_low is not None:
+            # Use heat range for low temp (heating setpoint)
+            temp_low = self._clamp(
+                temp_low,
+                target_min_heat_temp,
+                target_max_heat_temp,
+                "target_temp_low",
+                temp_unit,
+            )
+
+        if temp_high is not None:
+            # Use cool range for high temp (cooling setpoint)
+            temp_high = self._clamp(
+                temp_high,
+                target_min_cool_temp,
+                target_max_cool_temp,
+                "target_temp_high",
+                temp_unit,
+            )
+
+        # Ensure low <= high if both are set (the separate heat/cool ranges can still cross them)
+        if temp_low is not None and temp_high is not None:
+            if temp_low > temp_high:
+                _LOGGER.warning(
+                    "Auto mode: low temp (%.1f%s) > high temp (%.1f%s), adjusting to ensure low <= high",
+                    temp_low,
+                    temp_unit,
+                    temp_high,
+                    temp_unit,
+                )
+                # Swap them to maintain valid range
+                temp_low, temp_high = temp_high, temp_low
+
+            setpoints["target_temp_low"] = temp_low
+            setpoints["target_temp_high"] = temp_high
+        elif temp_low is not None:
+            setpoints["target_temp_low"] = temp_low
+        elif temp_high is not None:
+            setpoints["target_temp_high"] = temp_high
+
+        # Check if setpoints are actually changing (always re-send after a mode change)
+        new_low = setpoints.get("target_temp_low")
+        new_high = setpoints.get("target_temp_high")
+        temps_unchanged = (
+            not mode_changed
+            and not _needs_update(current_target_temp_low, new_low)
+            and not _needs_update(current_target_temp_high, new_high)
+        )
+
+        if temps_unchanged:
+            _LOGGER.debug(
+                "[%s] Auto mode temps unchanged: low=%s, high=%s - skipping update",
+                self.target_entity,
+                new_low,
+                new_high,
+            )
+            return {}
+
+        _LOGGER.info(
+            "[%s] Setting auto mode temps: low=%s, high=%s (current: low=%s, high=%s)",
+            self.target_entity,
+            new_low,
+            new_high,
+            current_target_temp_low,
+            current_target_temp_high,
+        )
+        return setpoints
+
+    def _single_setpoint(
+        self,
+        source_target_temp: float,
+        temp_offset: float,
+        target_min_temp: float,
+        target_max_temp: float,
+        current_target_temp: float | None,
+        mode_changed: bool,
+        temp_unit: str,
+    ) -> dict[str, float]:
+        """Return the setpoint to send in single setpoint modes (empty if unchanged)."""
+        clamped_temp = self._clamp(
+            source_target_temp + temp_offset,
+            target_min_temp,
+            target_max_temp,
+            ATTR_TEMPERATURE,
+            temp_unit,
+        )
+
+        # Check if temperature is actually changing (always re-send after a mode change)
+        if not mode_changed and not _needs_update(current_target_temp, clamped_temp):
+            _LOGGER.debug(
+                "[%s] Target temp unchanged: %.1f%s - skipping update",
+                self.target_entity,
+                clamped_temp,
+                temp_unit,
+            )
+            return {}
+
+        _LOGGER.info(
+            "[%s] Setting target temp: %.1f%s (source: %.1f%s, offset: %.1f%s, current: %s)",
+            self.target_entity,
+            clamped_temp,
+            temp_unit,
+            source_target_temp,
+            temp_unit,
+            temp_offset,
+            temp_unit,
+            current_target_temp,
+        )
+        return {ATTR_TEMPERATURE: clamped_temp}
+
     async def _async_sync_normal_mode(
         self,
         source_hvac_mode: str,
@@ -530,252 +1168,173 @@ class ClimateSyncManager:
         current_target_temp_low: float | None,
         current_target_temp_high: float | None,
         current_target_temp: float | None,
+        target_state: State,
     ) -> None:
         """Sync normal mode: match HVAC mode and temperature with optional offset."""
-        # Restore saved settings if exiting boost mode
-        if self._boost_active:
+        target_entity = self.target_entity
+        temp_unit = self.hass.config.units.temperature_unit
+        # Restore saved settings if exiting boost mode (sent together with the normal
+        # sync below; boost state is only reset once that has succeeded)
+        exiting_boost = self._boost_active
+        restore_calls: list[tuple[str, dict[str, Any]]] = []
+        if exiting_boost:
             _LOGGER.info(
                 "[%s] Exiting boost mode - restoring fan_mode: %s, swing_mode: %s",
-                self.target_entity,
+                target_entity,
                 self._saved_fan_mode,
                 self._saved_swing_mode,
             )
 
-            # Restore fan mode
-            if self._saved_fan_mode:
-                try:
-                    await self.hass.services.async_call(
-                        CLIMATE_DOMAIN,
+            tgt_attrs = target_state.attributes
+            if self._saved_fan_mode and _needs_update(tgt_attrs.get("fan_mode"), self._saved_fan_mode):
+                restore_calls.append(
+                    (
                         SERVICE_SET_FAN_MODE,
-                        {
-                            ATTR_ENTITY_ID: self.target_entity,
-                            "fan_mode": self._saved_fan_mode,
-                        },
-                        blocking=True,
+                        {ATTR_ENTITY_ID: target_entity, "fan_mode": self._saved_fan_mode},
                     )
-                    _LOGGER.debug("Fan mode restored to %s", self._saved_fan_mode)
-                except Exception as e:
-                    _LOGGER.error("Failed to restore fan mode: %s", e)
-
-            # Restore swing mode
-            if self._saved_swing_mode:
-                try:
-                    await self.hass.services.async_call(
-                        CLIMATE_DOMAIN,
+                )
+            if self._saved_swing_mode and _needs_update(tgt_attrs.get("swing_mode"), self._saved_swing_mode):
+                restore_calls.append(
+                    (
                         SERVICE_SET_SWING_MODE,
-                        {
-                            ATTR_ENTITY_ID: self.target_entity,
-                            "swing_mode": self._saved_swing_mode,
-                        },
-                        blocking=True,
+                        {ATTR_ENTITY_ID: target_entity, "swing_mode": self._saved_swing_mode},
                     )
-                    _LOGGER.debug("Swing mode restored to %s", self._saved_swing_mode)
-                except Exception as e:
-                    _LOGGER.error("Failed to restore swing mode: %s", e)
-
-            # Reset boost state
-            self._boost_active = False
-            self._saved_fan_mode = None
-            self._saved_swing_mode = None
-            self._boost_start_time = None
-
-        # Sync HVAC mode
-        if source_hvac_mode == current_target_hvac_mode:
-            _LOGGER.debug(
-                "[%s] HVAC mode unchanged: %s - skipping update",
-                self.target_entity,
-                source_hvac_mode,
-            )
-        else:
-            _LOGGER.info(
-                "[%s] Setting HVAC mode to %s (current: %s)",
-                self.target_entity,
-                source_hvac_mode,
-                current_target_hvac_mode,
-            )
-            try:
-                await self.hass.services.async_call(
-                    CLIMATE_DOMAIN,
-                    SERVICE_SET_HVAC_MODE,
-                    {
-                        ATTR_ENTITY_ID: self.target_entity,
-                        ATTR_HVAC_MODE: source_hvac_mode,
-                    },
-                    blocking=True,
                 )
-                _LOGGER.debug("HVAC mode set successfully")
-            except Exception as e:
-                _LOGGER.error("Failed to set HVAC mode: %s", e)
-                raise
 
         # Calculate temperature offset if enabled
         temp_offset = 0.0
         if (
-            self.enable_temp_offset
+            self.config.enable_temp_offset
             and source_temp is not None
             and target_temp is not None
         ):
-            temp_offset = (source_temp - target_temp) * self.offset_sensitivity
-            # Get temperature unit from Home Assistant config
-            temp_unit = self.hass.config.units.temperature_unit
+            temp_offset = (source_temp - target_temp) * self.config.offset_sensitivity
             _LOGGER.info(
                 "[%s → %s] Temperature offset: %.1f%s (source: %.1f%s, target: %.1f%s, sensitivity: %.1f)",
                 self.source_entity,
-                self.target_entity,
+                target_entity,
                 temp_offset,
                 temp_unit,
                 source_temp,
                 temp_unit,
                 target_temp,
                 temp_unit,
-                self.offset_sensitivity,
+                self.config.offset_sensitivity,
             )
-        elif self.enable_temp_offset:
+        elif self.config.enable_temp_offset:
             _LOGGER.debug(
                 "Offset enabled but missing temps: source=%s, target=%s",
                 source_temp,
                 target_temp,
             )
 
-        # Sync temperature setpoints
-        service_data: dict[str, Any] = {ATTR_ENTITY_ID: self.target_entity}
+        # Nothing to do if neither the sync inputs nor the target have changed since
+        # the last successful sync (the target's values catch manual changes/drift)
+        sync_fp = (
+            source_hvac_mode,
+            source_target_temp,
+            source_target_temp_low,
+            source_target_temp_high,
+            round(temp_offset, 2),
+            current_target_hvac_mode,
+            current_target_temp,
+            current_target_temp_low,
+            current_target_temp_high,
+        )
+        if sync_fp == self._last_sync_fp and not exiting_boost:
+            _LOGGER.debug("[%s] Nothing changed since last sync - skipping", target_entity)
+            return
 
-        # Get temperature unit for logging
-        temp_unit = self.hass.config.units.temperature_unit
+        # Sync HVAC mode (sent together with the setpoints below when there are any)
+        mode_changed = _needs_update(current_target_hvac_mode, source_hvac_mode)
+        if not mode_changed:
+            _LOGGER.debug(
+                "[%s] HVAC mode unchanged: %s - skipping update",
+                target_entity,
+                source_hvac_mode,
+            )
+        else:
+            _LOGGER.info(
+                "[%s] Setting HVAC mode to %s (current: %s)",
+                target_entity,
+                source_hvac_mode,
+                current_target_hvac_mode,
+            )
 
+        # Sync temperature setpoints
+        setpoints: dict[str, float] = {}
         if source_hvac_mode == HVACMode.HEAT_COOL:
-            # Auto mode: use both low and high temps
-            temp_low = None
-            temp_high = None
-
-            if source_target_temp_low is not None:
-                calculated_low = source_target_temp_low + temp_offset
-                # Use heat range for low temp (heating setpoint)
-                temp_low = max(target_min_heat_temp, min(target_max_heat_temp, calculated_low))
-                if temp_low != calculated_low:
-                    _LOGGER.warning(
-                        "Clamped target_temp_low from %.1f%s to %.1f%s (heat range: %.1f-%.1f%s)",
-                        calculated_low,
-                        temp_unit,
-                        temp_low,
-                        temp_unit,
-                        target_min_heat_temp,
-                        target_max_heat_temp,
-                        temp_unit,
-                    )
-
-            if source_target_temp_high is not None:
-                calculated_high = source_target_temp_high + temp_offset
-                # Use cool range for high temp (cooling setpoint)
-                temp_high = max(target_min_cool_temp, min(target_max_cool_temp, calculated_high))
-                if temp_high != calculated_high:
-                    _LOGGER.warning(
-                        "Clamped target_temp_high from %.1f%s to %.1f%s (cool range: %.1f-%.1f%s)",
-                        calculated_high,
-                        temp_unit,
-                        temp_high,
-                        temp_unit,
-                        target_min_cool_temp,
-                        target_max_cool_temp,
-                        temp_unit,
-                    )
-
-            # Ensure low <= high if both are set
-            if temp_low is not None and temp_high is not None:
-                if temp_low > temp_high:
-                    _LOGGER.warning(
-                        "Auto mode: low temp (%.1f%s) > high temp (%.1f%s), adjusting to ensure low <= high",
-                        temp_low,
-                        temp_unit,
-                        temp_high,
-                        temp_unit,
-                    )
-                    # Swap them to maintain valid range
-                    temp_low, temp_high = temp_high, temp_low
-
-                service_data["target_temp_low"] = temp_low
-                service_data["target_temp_high"] = temp_high
-            elif temp_low is not None:
-                service_data["target_temp_low"] = temp_low
-            elif temp_high is not None:
-                service_data["target_temp_high"] = temp_high
-
-            # Check if setpoints are actually changing
-            new_low = service_data.get("target_temp_low")
-            new_high = service_data.get("target_temp_high")
-            temps_unchanged = (new_low == current_target_temp_low and new_high == current_target_temp_high)
-
-            if temps_unchanged:
-                _LOGGER.debug(
-                    "[%s] Auto mode temps unchanged: low=%s, high=%s - skipping update",
-                    self.target_entity,
-                    new_low,
-                    new_high,
-                )
-                # Clear service_data to skip the service call
-                service_data = {ATTR_ENTITY_ID: self.target_entity}
-            else:
-                _LOGGER.info(
-                    "[%s] Setting auto mode temps: low=%s, high=%s (current: low=%s, high=%s)",
-                    self.target_entity,
-                    new_low,
-                    new_high,
-                    current_target_temp_low,
-                    current_target_temp_high,
-                )
+            setpoints = self._heat_cool_setpoints(
+                source_target_temp_low,
+                source_target_temp_high,
+                temp_offset,
+                target_min_heat_temp,
+                target_max_heat_temp,
+                target_min_cool_temp,
+                target_max_cool_temp,
+                current_target_temp_low,
+                current_target_temp_high,
+                mode_changed,
+                temp_unit,
+            )
         elif source_target_temp is not None:
-            # Single setpoint modes (heat, cool)
-            calculated_temp = source_target_temp + temp_offset
-            clamped_temp = max(target_min_temp, min(target_max_temp, calculated_temp))
-
-            if clamped_temp != calculated_temp:
-                _LOGGER.warning(
-                    "Clamped temperature from %.1f%s to %.1f%s (range: %.1f-%.1f%s)",
-                    calculated_temp,
-                    temp_unit,
-                    clamped_temp,
-                    temp_unit,
-                    target_min_temp,
-                    target_max_temp,
-                    temp_unit,
-                )
-
-            # Check if temperature is actually changing
-            if clamped_temp == current_target_temp:
-                _LOGGER.debug(
-                    "[%s] Target temp unchanged: %.1f%s - skipping update",
-                    self.target_entity,
-                    clamped_temp,
-                    temp_unit,
-                )
-            else:
-                service_data[ATTR_TEMPERATURE] = clamped_temp
-                _LOGGER.info(
-                    "[%s] Setting target temp: %.1f%s (source: %.1f%s, offset: %.1f%s, current: %s)",
-                    self.target_entity,
-                    service_data[ATTR_TEMPERATURE],
-                    temp_unit,
-                    source_target_temp,
-                    temp_unit,
-                    temp_offset,
-                    temp_unit,
-                    current_target_temp,
-                )
+            setpoints = self._single_setpoint(
+                source_target_temp,
+                temp_offset,
+                target_min_temp,
+                target_max_temp,
+                current_target_temp,
+                mode_changed,
+                temp_unit,
+            )
         else:
             _LOGGER.debug("No temperature setpoint available from source")
 
-        # Only call service if we have temperature data
-        if len(service_data) > 1:  # More than just entity_id
-            try:
-                await self.hass.services.async_call(
-                    CLIMATE_DOMAIN,
-                    SERVICE_SET_TEMPERATURE,
-                    service_data,
-                    blocking=True,
+        # Only call set_temperature if we have temperature data; it carries the
+        # HVAC mode too, so a mode change without setpoints (e.g. off) goes on its own
+        sync_call: Callable[[], Coroutine[Any, Any, None]] | None = None
+        if setpoints:
+            sync_call = partial(
+                self._async_set_target_temperature,
+                {ATTR_ENTITY_ID: target_entity, **setpoints},
+                source_hvac_mode if mode_changed else None,
+            )
+        else:
+            _LOGGER.debug("No temperature data to sync")
+            if mode_changed:
+                sync_call = partial(
+                    self._async_set_target_mode, source_hvac_mode, current_target_hvac_mode
                 )
-                _LOGGER.debug("Temperature set successfully")
-            except Exception as e:
-                _LOGGER.error("Failed to set temperature: %s", e)
-                raise
+
+        # Restore failures are logged but must not block the normal sync. Without a
+        # mode change both can go out at once; otherwise fan/swing are restored in
+        # the boost mode first, as the new mode (e.g. off) may not accept them.
+        if sync_call and restore_calls and not mode_changed and self.config.parallel_target_calls:
+            _, failed_restores = await asyncio.gather(
+                sync_call(), self._async_call_target_services(restore_calls)
+            )
         else:
-            _LOGGER.debug("No temperature data to sync")
\ No newline at end of file
+            failed_restores = await self._async_call_target_services(restore_calls)
+            if sync_call:
+                await sync_call()
+
+        if exiting_boost and failed_restores:
+            # Keep boost state, and with it the saved modes, so the next sync retries
+            # the restore (calls that already went through are skipped then)
+            _LOGGER.warning(
+                "[%s] Restoring fan/swing after boost failed, will retry on the next sync",
+                target_entity,
+            )
+            self._boost_exit_pending = True
+        elif exiting_boost:
+            # Reset boost state
+            self._boost_exit_pending = False
+            self._boost_active = False
+            self._saved_fan_mode = None
+            self._saved_swing_mode = None
+            self._boost_start_mono = None
+            self._last_relevant_key = None
+            await self._async_save_boost_state()
+
+        # Keep re-checking until the target confirms a mode sent within set_temperature
+        self._last_sync_fp = None if self._combined_mode_sent else sync_fp
\ No newline at end of file
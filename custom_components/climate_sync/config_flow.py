@@ -21,14 +21,81 @@ from .const import (
     CONF_ENABLE_BOOST_MODE,
     CONF_OFFSET_SENSITIVITY,
     CONF_SYNC_INTERVAL,
+    CONF_PARALLEL_TARGET_CALLS,
+    CONF_DEBOUNCE_MS,
     DEFAULT_ENABLE_TEMP_OFFSET,
     DEFAULT_ENABLE_BOOST_MODE,
     DEFAULT_OFFSET_SENSITIVITY,
     DEFAULT_SYNC_INTERVAL,
+    DEFAULT_PARALLEL_TARGET_CALLS,
+    DEFAULT_DEBOUNCE_MS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Selectors are shared by both flows and built once at import
+_CLIMATE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=CLIMATE_DOMAIN)
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_SENSITIVITY_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.1,
+        max=5.0,
+        step=0.1,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_SYNC_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=60,
+        step=1,
+        unit_of_measurement="minutes",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_DEBOUNCE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=5000,
+        step=50,
+        unit_of_measurement="ms",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SOURCE_CLIMATE): _CLIMATE_SELECTOR,
+        vol.Required(CONF_TARGET_CLIMATE): _CLIMATE_SELECTOR,
+        vol.Optional(
+            CONF_ENABLE_TEMP_OFFSET,
+            default=DEFAULT_ENABLE_TEMP_OFFSET,
+        ): _BOOLEAN_SELECTOR,
+        vol.Optional(
+            CONF_ENABLE_BOOST_MODE,
+            default=DEFAULT_ENABLE_BOOST_MODE,
+        ): _BOOLEAN_SELECTOR,
+        vol.Optional(
+            CONF_OFFSET_SENSITIVITY,
+            default=DEFAULT_OFFSET_SENSITIVITY,
+        ): _SENSITIVITY_SELECTOR,
+        vol.Optional(
+            CONF_SYNC_INTERVAL,
+            default=DEFAULT_SYNC_INTERVAL,
+        ): _SYNC_INTERVAL_SELECTOR,
+        vol.Optional(
+            CONF_PARALLEL_TARGET_CALLS,
+            default=DEFAULT_PARALLEL_TARGET_CALLS,
+        ): _BOOLEAN_SELECTOR,
+        vol.Optional(
+            CONF_DEBOUNCE_MS,
+            default=DEFAULT_DEBOUNCE_MS,
+        ): _DEBOUNCE_SELECTOR,
+    }
+)
+
 
 class ClimateSyncConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Climate Sync."""
@@ -57,57 +124,17 @@ class ClimateSyncConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 user_input.setdefault(CONF_ENABLE_BOOST_MODE, DEFAULT_ENABLE_BOOST_MODE)
                 user_input.setdefault(CONF_OFFSET_SENSITIVITY, DEFAULT_OFFSET_SENSITIVITY)
                 user_input.setdefault(CONF_SYNC_INTERVAL, DEFAULT_SYNC_INTERVAL)
+                user_input.setdefault(CONF_PARALLEL_TARGET_CALLS, DEFAULT_PARALLEL_TARGET_CALLS)
+                user_input.setdefault(CONF_DEBOUNCE_MS, DEFAULT_DEBOUNCE_MS)
 
                 return self.async_create_entry(
                     title=f"{user_input[CONF_SOURCE_CLIMATE]} → {user_input[CONF_TARGET_CLIMATE]}",
                     data=user_input,
                 )
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_SOURCE_CLIMATE): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=CLIMATE_DOMAIN)
-                ),
-                vol.Required(CONF_TARGET_CLIMATE): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=CLIMATE_DOMAIN)
-                ),
-                vol.Optional(
-                    CONF_ENABLE_TEMP_OFFSET,
-                    default=DEFAULT_ENABLE_TEMP_OFFSET,
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_ENABLE_BOOST_MODE,
-                    default=DEFAULT_ENABLE_BOOST_MODE,
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_OFFSET_SENSITIVITY,
-                    default=DEFAULT_OFFSET_SENSITIVITY,
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.1,
-                        max=5.0,
-                        step=0.1,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    CONF_SYNC_INTERVAL,
-                    default=DEFAULT_SYNC_INTERVAL,
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1,
-                        max=60,
-                        step=1,
-                        unit_of_measurement="minutes",
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -144,40 +171,37 @@ class ClimateSyncOptionsFlow(config_entries.OptionsFlow):
                     default=current_values.get(
                         CONF_ENABLE_TEMP_OFFSET, DEFAULT_ENABLE_TEMP_OFFSET
                     ),
-                ): selector.BooleanSelector(),
+                ): _BOOLEAN_SELECTOR,
                 vol.Optional(
                     CONF_ENABLE_BOOST_MODE,
                     default=current_values.get(
                         CONF_ENABLE_BOOST_MODE, DEFAULT_ENABLE_BOOST_MODE
                     ),
-                ): selector.BooleanSelector(),
+                ): _BOOLEAN_SELECTOR,
                 vol.Optional(
                     CONF_OFFSET_SENSITIVITY,
                     default=current_values.get(
                         CONF_OFFSET_SENSITIVITY, DEFAULT_OFFSET_SENSITIVITY
                     ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.1,
-                        max=5.0,
-                        step=0.1,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
+                ): _SENSITIVITY_SELECTOR,
                 vol.Optional(
                     CONF_SYNC_INTERVAL,
                     default=current_values.get(
                         CONF_SYNC_INTERVAL, DEFAULT_SYNC_INTERVAL
                     ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1,
-                        max=60,
-                        step=1,
-                        unit_of_measurement="minutes",
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
+                ): _SYNC_INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_PARALLEL_TARGET_CALLS,
+                    default=current_values.get(
+                        CONF_PARALLEL_TARGET_CALLS, DEFAULT_PARALLEL_TARGET_CALLS
+                    ),
+                ): _BOOLEAN_SELECTOR,
+                vol.Optional(
+                    CONF_DEBOUNCE_MS,
+                    default=current_values.get(
+                        CONF_DEBOUNCE_MS, DEFAULT_DEBOUNCE_MS
+                    ),
+                ): _DEBOUNCE_SELECTOR,
             }
         )
 
@@ -9,13 +9,35 @@ CONF_ENABLE_TEMP_OFFSET = "enable_temp_offset"
 CONF_ENABLE_BOOST_MODE = "enable_boost_mode"
 CONF_OFFSET_SENSITIVITY = "offset_sensitivity"
 CONF_SYNC_INTERVAL = "sync_interval"
+CONF_PARALLEL_TARGET_CALLS = "parallel_target_calls"
+CONF_DEBOUNCE_MS = "debounce_ms"
 
 # Default values
 DEFAULT_ENABLE_TEMP_OFFSET = True
 DEFAULT_ENABLE_BOOST_MODE = True
 DEFAULT_OFFSET_SENSITIVITY = 1.0
 DEFAULT_SYNC_INTERVAL = 5  # minutes
+DEFAULT_PARALLEL_TARGET_CALLS = True
+DEFAULT_DEBOUNCE_MS = 300  # milliseconds - window for coalescing bursts of source state changes
+
+# Periodic sync is skipped if another sync completed within the interval minus this slack
+PERIODIC_SYNC_GRACE = 5  # seconds
+# Polling interval while boost activation is pending or boost is active
+ACTIVE_SYNC_INTERVAL = 30  # seconds
 
 # Boost mode timing
 BOOST_ACTIVATION_DELAY = 15  # minutes - how long to wait before activating boost
-BOOST_MINIMUM_RUNTIME = 10  # minutes - minimum time to stay in boost mode
\ No newline at end of file
+BOOST_MINIMUM_RUNTIME = 10  # minutes - minimum time to stay in boost mode
+
+# Fan modes to use in boost mode, most powerful first
+PREFERRED_BOOST_FAN_MODES = ("superPowerful", "powerful", "high", "medium", "low", "auto")
+
+# Version of the per-entry store that keeps boost state across reloads and restarts
+STORAGE_VERSION = 1
+
+# Setpoint differences smaller than this are treated as already in sync
+TEMP_EPSILON = 0.05
+
+# How long a target may take to report an HVAC mode sent within set_temperature
+# before it is assumed to ignore it there (polled cloud units can take a while)
+HVAC_MODE_CONFIRM_TIMEOUT = 120  # seconds